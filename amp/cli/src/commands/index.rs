@@ -201,6 +201,11 @@ pub async fn run_index(path: &str, exclude: &[String], init_root: bool, client:
         match entry {
             Ok(entry) => {
                 let path = entry.path();
+                // Walker entries carry the file type from readdir; only symlinks need a stat
+                let (is_dir, is_file) = match entry.file_type() {
+                    Some(file_type) if !file_type.is_symlink() => (file_type.is_dir(), file_type.is_file()),
+                    _ => (path.is_dir(), path.is_file()),
+                };
                 
                 // Skip if matches exclude patterns
                 if should_exclude(path, &exclude_patterns) {
@@ -209,7 +214,7 @@ pub async fn run_index(path: &str, exclude: &[String], init_root: bool, client:
                 }
                 
                 // Ensure directory chain exists for this entry
-                if let Some(dir_path) = if path.is_dir() { Some(path) } else { path.parent() } {
+                if let Some(dir_path) = if is_dir { Some(path) } else { path.parent() } {
                     if dir_path != root_path {
                         if let Err(e) = ensure_directory_chain(
                             dir_path,
@@ -232,7 +237,7 @@ pub async fn run_index(path: &str, exclude: &[String], init_root: bool, client:
                 }
                 
                 // Check if it's a file and if it's a text file
-                if path.is_file() {
+                if is_file {
                     // Only process text files, skip binary files
                     if is_text_file(path) {
                         files_to_process.push(path.to_path_buf());
@@ -7,7 +7,7 @@ Demonstrates basic usage of the Agentic Memory Protocol client.
 import asyncio
 import uuid
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
 # Note: This will work after SDK generation
 # from amp_client import ApiClient, Configuration, ObjectsApi, QueryApi
@@ -15,15 +15,16 @@ from typing import List
 class MockAmpClient:
     """Mock client for demonstration until SDK is generated"""
     
-    async def create_symbol(self, name: str, kind: str, path: str, language: str):
+    async def create_symbol(self, name: str, kind: str, path: str, language: str) -> Dict[str, Any]:
         """Create a symbol object"""
+        now = datetime.utcnow().isoformat()
         symbol = {
             "id": str(uuid.uuid4()),
             "type": "symbol",
             "tenant_id": "default",
             "project_id": "example_project",
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "provenance": {
                 "agent": "python_example",
                 "summary": f"Created symbol {name}"
@@ -36,15 +37,16 @@ class MockAmpClient:
         print(f"Created symbol: {symbol['name']} ({symbol['id']})")
         return symbol
     
-    async def create_decision(self, title: str, problem: str, rationale: str, outcome: str):
+    async def create_decision(self, title: str, problem: str, rationale: str, outcome: str) -> Dict[str, Any]:
         """Create a decision object"""
+        now = datetime.utcnow().isoformat()
         decision = {
             "id": str(uuid.uuid4()),
             "type": "decision",
             "tenant_id": "default",
             "project_id": "example_project",
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "provenance": {
                 "agent": "python_example",
                 "summary": f"Made decision: {title}"
@@ -58,7 +60,7 @@ class MockAmpClient:
         print(f"Created decision: {decision['title']} ({decision['id']})")
         return decision
     
-    async def query_objects(self, text: str, limit: int = 10):
+    async def query_objects(self, text: str, limit: int = 10) -> Dict[str, Any]:
         """Query objects using text search"""
         print(f"Querying for: '{text}' (limit: {limit})")
         # Mock response
@@ -69,7 +71,7 @@ class MockAmpClient:
             "execution_time_ms": 42
         }
 
-async def main():
+async def main() -> None:
     """Demonstrate AMP usage patterns"""
     print("🚀 AMP Python SDK Example")
     print("=" * 40)
@@ -33,6 +33,19 @@ pub struct ParseFileRequest {
     pub tenant_id: Option<String>,
 }
 
+#[derive(Debug, Deserialize)]
+pub struct ParseFilesRequest {
+    pub files: Vec<ParseFilesEntry>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct ParseFilesEntry {
+    pub file_path: String,
+    /// Inline source; when present the file is not read from disk.
+    pub content: Option<String>,
+    pub language: Option<String>,
+}
+
 #[derive(Debug, Deserialize)]
 pub struct UpdateFileLogRequest {
     #[serde(alias = "path")]
@@ -75,6 +88,25 @@ pub struct FileLogResponse {
     pub markdown: String,
 }
 
+#[derive(Debug, Serialize)]
+pub struct ParseFilesResult {
+    pub file_path: String,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub file_log: Option<FileLog>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub markdown: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<String>,
+}
+
+#[derive(Debug, Serialize)]
+pub struct ParseFilesResponse {
+    pub success: bool,
+    pub files_parsed: usize,
+    /// One entry per requested file, in request order.
+    pub results: Vec<ParseFilesResult>,
+}
+
 #[derive(Debug, Serialize)]
 pub struct FileLogObjectResponse {
     pub file_log: serde_json::Value,
@@ -176,6 +208,69 @@ pub async fn parse_file(
     Ok(Json(FileLogResponse { file_log, markdown }))
 }
 
+/// Parse a batch of files in one request, reusing a single parser
+pub async fn parse_files(
+    State(_state): State<AppState>,
+    Json(request): Json<ParseFilesRequest>,
+) -> Result<Json<ParseFilesResponse>, StatusCode> {
+    tracing::info!("Parsing {} files", request.files.len());
+
+    let parser = CodebaseParser::new().map_err(|e| {
+        tracing::error!("Failed to create parser: {}", e);
+        StatusCode::INTERNAL_SERVER_ERROR
+    })?;
+
+    let mut results = Vec::with_capacity(request.files.len());
+    let mut files_parsed = 0;
+
+    for entry in request.files {
+        let mut file_path = PathBuf::from(&entry.file_path);
+        if entry.content.is_none() && !file_path.exists() {
+            if let Some(mapped) = map_windows_mount(&entry.file_path) {
+                file_path = mapped;
+            }
+        }
+
+        let language = entry
+            .language
+            .unwrap_or_else(|| detect_language(&file_path));
+
+        let parsed = match &entry.content {
+            Some(content) => parser.parse_content(&file_path, content, &language),
+            None if file_path.exists() => parser.parse_file(&file_path, &language),
+            None => Err(anyhow::anyhow!("File does not exist")),
+        };
+
+        match parsed {
+            Ok(file_log) => {
+                let markdown = parser.generate_file_log_markdown(&file_log);
+                files_parsed += 1;
+                results.push(ParseFilesResult {
+                    file_path: entry.file_path,
+                    file_log: Some(file_log),
+                    markdown: Some(markdown),
+                    error: None,
+                });
+            }
+            Err(e) => {
+                tracing::warn!("Failed to parse {}: {}", entry.file_path, e);
+                results.push(ParseFilesResult {
+                    file_path: entry.file_path,
+                    file_log: None,
+                    markdown: None,
+                    error: Some(e.to_string()),
+                });
+            }
+        }
+    }
+
+    Ok(Json(ParseFilesResponse {
+        success: files_parsed == results.len(),
+        files_parsed,
+        results,
+    }))
+}
+
 /// Update file log with new change information
 pub async fn update_file_log(
     State(state): State<AppState>,
@@ -1924,12 +2019,15 @@ pub async fn sync_file(
         )
     })?;
 
-    let file_log = parser.parse_file(&file_path, &language).map_err(|e| {
-        (
-            StatusCode::INTERNAL_SERVER_ERROR,
-            Json(serde_json::json!({ "error": format!("Failed to parse file: {}", e) })),
-        )
-    })?;
+    // Parse the content already read above instead of reading the file again
+    let file_log = parser
+        .parse_content(&file_path, &content, &language)
+        .map_err(|e| {
+            (
+                StatusCode::INTERNAL_SERVER_ERROR,
+                Json(serde_json::json!({ "error": format!("Failed to parse file: {}", e) })),
+            )
+        })?;
 
     // Extract symbol names and dependencies from parsed FileLog
     let symbol_names: Vec<String> = file_log.symbols.iter().map(|s| s.name.clone()).collect();
@@ -196,6 +196,10 @@ fn api_routes() -> Router<AppState> {
         // Codebase parsing endpoints
         .route("/codebase/parse", post(handlers::codebase::parse_codebase))
         .route("/codebase/parse-file", post(handlers::codebase::parse_file))
+        .route(
+            "/codebase/parse-files",
+            post(handlers::codebase::parse_files),
+        )
         .route(
             "/codebase/delete",
             post(handlers::codebase::delete_codebase),
@@ -700,7 +700,10 @@ impl CodebaseParser {
             .filter_map(|e| e.ok())
         {
             let path = entry.path();
-            if path.is_file() {
+            // DirEntry caches the file type from readdir; only symlinks need a stat
+            let is_file =
+                entry.file_type().is_file() || (entry.path_is_symlink() && path.is_file());
+            if is_file {
                 if let Some(extension) = path.extension() {
                     let ext_str = extension.to_string_lossy();
                     match ext_str.as_ref() {
@@ -765,7 +768,18 @@ impl CodebaseParser {
 
     pub fn parse_file(&self, file_path: &Path, language: &str) -> Result<FileLog> {
         let content = std::fs::read_to_string(file_path)?;
-        let content_hash = self.compute_hash(&content);
+        self.parse_content(file_path, &content, language)
+    }
+
+    /// Parse in-memory source without touching the filesystem.
+    /// `file_path` is only used to label the resulting file log and symbols.
+    pub fn parse_content(
+        &self,
+        file_path: &Path,
+        content: &str,
+        language: &str,
+    ) -> Result<FileLog> {
+        let content_hash = self.compute_hash(content);
 
         let mut parser = Parser::new();
         let queries = match language {
@@ -812,7 +826,7 @@ impl CodebaseParser {
             _ => {
                 // For unsupported languages, return a basic file log without parsing
                 let mut hasher = Sha256::new();
-                hasher.update(&content);
+                hasher.update(content);
                 let hash = format!("{:x}", hasher.finalize());
 
                 return Ok(FileLog {
@@ -836,11 +850,11 @@ impl CodebaseParser {
         };
 
         let tree = parser
-            .parse(&content, None)
+            .parse(content, None)
             .ok_or_else(|| anyhow!("Failed to parse file: {}", file_path.display()))?;
 
-        let symbols = self.extract_symbols(&tree, &content, &queries, file_path, language)?;
-        let dependencies = self.extract_dependencies(&tree, &content, &queries)?;
+        let symbols = self.extract_symbols(&tree, content, &queries, file_path, language)?;
+        let dependencies = self.extract_dependencies(&tree, content, &queries)?;
 
         Ok(FileLog {
             path: file_path.to_string_lossy().to_string(),
@@ -1,8 +1,8 @@
-import asyncio
+from asyncio import sleep as _sleep, run as _run
 
 async def ping(name: str) -> str:
-    await asyncio.sleep(0.01)
+    await _sleep(0.01)
     return f"pong {name}"
 
 if __name__ == "__main__":
-    print(asyncio.run(ping("test")))
+    print(_run(ping("test")))
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 MAX_RETRIES = 3
 API_VERSION = "v1"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     """User data model"""
     id: int
@@ -59,7 +59,10 @@ def calculate_fibonacci(n: int) -> int:
     """Calculate nth Fibonacci number"""
     if n <= 1:
         return n
-    return calculate_fibonacci(n - 1) + calculate_fibonacci(n - 2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 def process_data(data: List[Dict], filter_fn=None) -> List[Dict]:
     """Process data with optional filter"""
@@ -82,8 +85,7 @@ def main():
         User(2, "Bob", "bob@example.com")
     ]
     
-    for user in users:
-        print(user.to_dict())
+    sys.stdout.write("".join(f"{user.to_dict()}\n" for user in users))
     
     db.disconnect()
 